@@ -19,6 +19,9 @@ The client reports (publishes to) the following status (topics):
 - <client_id>/status/cpu_temperature (qos = 0, retained = true,
   message = temperature)
 - <client_id>/status/D5 (qos = 0, retained = true, message = high | low)
+- <client_id>/status/batch (qos = 0, retained = false, message = JSON object
+  combining multiple status updates that occurred within the same loop cycle;
+  supplements the individual retained status topics above)
 
 The following Mosquitto commands can be used on your computer to interact with
 the Raspberry Pi client.  Change the client ID, username, and password options
@@ -44,12 +47,22 @@ Circuit
 Libraries/Modules
 -----------------
 
+- *sys* Standard Library
+    - https://docs.python.org/3/library/sys.html
+    - Provides the interpreter identification used for platform detection.
+- *json* Standard Library
+    - https://docs.python.org/3/library/json.html
+    - Provides encoding of batched status messages.
 - *time* Standard Library
     - https://docs.python.org/3/library/time.html
-    - Provides access to the *sleep* function.
+    - Provides access to the *sleep*, *monotonic*, and *monotonic_ns*
+      functions.
 - *socket* Standard Library
     - https://docs.python.org/3/library/socket.html
     - Provides a low-level networking interface on a Raspberry Pi SBC.
+- *select* Standard Library
+    - https://docs.python.org/3/library/select.html
+    - Provides readiness polling of the MQTT socket on a Raspberry Pi SBC.
 - *board* CircuitPython Core Module
     - https://circuitpython.readthedocs.io/en/latest/shared-bindings/board/
     - Provides access to the board's GPIO pins and hardware.
@@ -66,9 +79,6 @@ Libraries/Modules
 - *wifi* CircuitPython Core Module
     - https://docs.circuitpython.org/en/latest/shared-bindings/wifi/
     - Provides low-level WiFi functionality on a Raspberry Pi Pico W.
-- *GPIO Zero* Library
-    - https://gpiozero.readthedocs.io
-    - Provides access to the CPU temperature on a Raspberry Pi SBC.
 - *RPi.GPIO* Library
     - https://pypi.org/project/RPi.GPIO/
     - Provides access to the *cleanup* method on a Raspberry Pi SBC.
@@ -110,19 +120,22 @@ Members
 
 
 # Imports
-from time import sleep
+import sys
+import json
+from time import sleep, monotonic, monotonic_ns
 import board
 from digitalio import DigitalInOut, Direction
 import microcontroller
-try:
-    import gpiozero
-    import RPi.GPIO as GPIO
-    IS_RASPBERRY_PI_SBC = True
-except:
-    IS_RASPBERRY_PI_SBC = False
+IS_RASPBERRY_PI_SBC = sys.implementation.name == "cpython"
 if IS_RASPBERRY_PI_SBC:
-    import socket
-elif board.board_id == "raspberry_pi_pico_w":
+    try:
+        import RPi.GPIO as GPIO
+        import socket
+        import select
+    except ImportError:  # CPython without the Raspberry Pi libraries installed
+        IS_RASPBERRY_PI_SBC = False
+IS_PICO_W = not IS_RASPBERRY_PI_SBC and board.board_id == "raspberry_pi_pico_w"
+if IS_PICO_W:
     import socketpool
     import wifi
 import adafruit_logging as logger
@@ -138,7 +151,7 @@ except ImportError:
 if IS_RASPBERRY_PI_SBC:
     gpio_d5: microcontroller.Pin = DigitalInOut(board.D5)
     """The D5 GPIO pin."""
-elif board.board_id == "raspberry_pi_pico_w":
+elif IS_PICO_W:
     gpio_d5: microcontroller.Pin = DigitalInOut(board.GP5)  # use board.LED to control on-board LED
     """The D5 GPIO pin."""
 
@@ -151,19 +164,95 @@ DEBUG: int = 1
 `2` = program and MQTT logging messages are printed.
 """
 
+if DEBUG:
+    def dbg(*args, **kwargs) -> None:
+        """Prints a debugging message; bound at import so call sites need no
+        `if DEBUG:` guard."""
 
-# Global Variables
-previous_gpio_d5_value: bool = False
-"""The previous value of the D5 GPIO pin."""
+        print(*args, **kwargs)
+else:
+    def dbg(*args, **kwargs) -> None:
+        """Discards a debugging message; bound at import so call sites need no
+        `if DEBUG:` guard."""
+
+        pass
+
+CLIENT_ID: str = secrets.mqtt["client_id"]
+"""The MQTT client ID, retrieved once from the *secrets* module."""
+
+TOPIC_STATUS_CPU: str = f"{CLIENT_ID}/status/cpu_temperature"
+"""The MQTT topic used for publishing the CPU temperature status."""
+
+TOPIC_STATUS_D5: str = f"{CLIENT_ID}/status/D5"
+"""The MQTT topic used for publishing the D5 GPIO pin status."""
+
+TOPIC_STATUS_BATCH: str = f"{CLIENT_ID}/status/batch"
+"""The MQTT topic used for publishing multiple status updates coalesced into a
+single JSON message."""
 
-previous_cpu_temperature_value: float = 0.0
-"""The previous value of the CPU temperature."""
+TOPIC_CMD_CPU: str = f"{CLIENT_ID}/command/cpu_temperature"
+"""The MQTT topic used for receiving CPU temperature commands."""
 
-high_cpu_temperature_alert: bool = False
-"""The current status of the high cpu temperature alert;
-`False` = alert is off, `True` = alert is on.
+TOPIC_CMD_D5: str = f"{CLIENT_ID}/command/D5"
+"""The MQTT topic used for receiving D5 GPIO pin commands."""
+
+TOPIC_CMD_WILDCARD: str = f"{CLIENT_ID}/command/#"
+"""The MQTT topic wildcard used for subscribing to all incoming commands."""
+
+MQTT_KEEP_ALIVE: int = 60
+"""The MQTT keep alive interval, in seconds, between broker ping requests."""
+
+MQTT_RECONNECT_DELAY_MAX: float = 30.0
+"""The maximum delay, in seconds, between MQTT broker connection attempts."""
+
+MQTT_LOOP_MAX_READS: int = 8
+"""The maximum number of MQTT message reads performed per loop cycle; bounds
+the time spent draining a command burst so status reporting stays responsive.
 """
 
+MQTT_SOCKET_TIMEOUT: float = 0.05
+"""The timeout, in seconds, for individual MQTT socket reads; also passed to
+each drain iteration of the MQTT client loop, which requires its timeout to be
+at least the socket timeout."""
+
+CPU_TEMPERATURE_SAMPLE_INTERVAL_NS: int = 2_000_000_000
+"""The minimum interval, in nanoseconds, between CPU temperature samples;
+amortizes the cost of the temperature read across many loop cycles.
+"""
+
+CPU_TEMPERATURE_FILE: str = "/sys/class/thermal/thermal_zone0/temp"
+"""The sysfs file providing the CPU temperature, in millidegrees Celsius, on a
+Raspberry Pi SBC."""
+
+MQTT_RECV_TIMEOUT: int = 10
+"""The timeout, in seconds, for receiving a complete MQTT message."""
+
+MQTT_RECV_BUFFER_LIMIT: int = 2048
+"""The maximum receive buffer size, in bytes, allocated for a single MQTT
+message read; all expected messages fit well within this limit."""
+
+MQTT_SOCKET_BUSY_POLL_US: int = 50
+"""The busy-poll budget, in microseconds, applied to the MQTT socket's receive
+path on a Raspberry Pi SBC via the kernel's *SO_BUSY_POLL* option."""
+
+STATUS_D5_HIGH: bytes = b"high"
+"""The D5 GPIO pin high status message, pre-encoded to avoid a string
+allocation per publish."""
+
+STATUS_D5_LOW: bytes = b"low"
+"""The D5 GPIO pin low status message, pre-encoded to avoid a string
+allocation per publish."""
+
+ALERT_LED_ON: bytes = b"on"
+"""The Arduino LED on command message, pre-encoded to avoid a string
+allocation per publish."""
+
+ALERT_LED_OFF: bytes = b"off"
+"""The Arduino LED off command message, pre-encoded to avoid a string
+allocation per publish."""
+
+
+# Global Variables
 cpu_temperature_threshold_high: float = 58
 """The high temperature threshold that enables the high cpu temperature alert."""
 
@@ -171,7 +260,74 @@ cpu_temperature_threshold_low: float = 56
 """The low temperature threshold that disables the high cpu temperature alert."""
 
 
+class _State:
+    """The container for the program's mutable runtime state.
+
+    Keeping the state on one slotted object lets the hot path update it through
+    attribute access instead of module global (dict) writes.
+
+    :param bool previous_gpio_d5_value: The previous value of the D5 GPIO pin.
+    :param float previous_cpu_temperature_value: The previous value of the CPU
+        temperature.
+    :param bool high_cpu_temperature_alert: The current status of the high cpu
+        temperature alert; `False` = alert is off, `True` = alert is on.
+    :param float mqtt_reconnect_delay: The current delay, in seconds, before
+        the next MQTT broker reconnection attempt; doubles after each failed
+        attempt up to *MQTT_RECONNECT_DELAY_MAX*.
+    :param float mqtt_next_reconnect_time: The earliest time, from
+        *time.monotonic()*, at which the next MQTT broker reconnection attempt
+        may occur.
+    :param int next_cpu_temperature_sample_time: The earliest time, from
+        *time.monotonic_ns()*, at which the next CPU temperature sample may be
+        taken.
+    :param float next_mqtt_maintenance_time: The latest time, from
+        *time.monotonic()*, by which the MQTT client loop must run even on an
+        idle socket so keep alive pings are still sent.
+    """
+
+    __slots__ = (
+        "previous_gpio_d5_value",
+        "previous_cpu_temperature_value",
+        "high_cpu_temperature_alert",
+        "mqtt_reconnect_delay",
+        "mqtt_next_reconnect_time",
+        "next_cpu_temperature_sample_time",
+        "next_mqtt_maintenance_time"
+    )
+
+    def __init__(self) -> None:
+        self.previous_gpio_d5_value: bool = False
+        self.previous_cpu_temperature_value: float = 0.0
+        self.high_cpu_temperature_alert: bool = False
+        self.mqtt_reconnect_delay: float = 1.0
+        self.mqtt_next_reconnect_time: float = 0.0
+        self.next_cpu_temperature_sample_time: int = 0
+        self.next_mqtt_maintenance_time: float = 0.0
+
+
+state: _State = _State()
+"""The instance of the program's mutable runtime state."""
+
+
 # Global Instances
+if IS_RASPBERRY_PI_SBC:
+    cpu_temperature_file = open(CPU_TEMPERATURE_FILE, "r")
+    """The CPU temperature sysfs file, opened once so each reading is a single
+    seek and read instead of a full open/close cycle."""
+
+    def _read_cpu_temp() -> float:
+        """Reads the current CPU temperature, in degrees Celsius; bound at
+        import so readings need no platform check."""
+
+        cpu_temperature_file.seek(0)
+        return int(cpu_temperature_file.read()) / 1000.0
+else:
+    def _read_cpu_temp() -> float:
+        """Reads the current CPU temperature, in degrees Celsius; bound at
+        import so readings need no platform check."""
+
+        return microcontroller.cpu.temperature
+
 mqtt_client: MQTT = None
 """The instance of the MQTT client."""
 
@@ -188,13 +344,8 @@ def mqtt_command_cpu_temperature_received(client: MQTT, topic: str, message: str
     :param str message: The message of the incoming MQTT based command.
     """
 
-    if DEBUG:
-        print(f"Command received: {topic} {message}")
-    if message == "get":
-        mqtt_publish_cpu_temperature_status()
-    else:
-        if DEBUG:
-            print("ERROR: Unknown command.")
+    dbg(f"Command received: {topic} {message}")
+    _CPU_COMMAND_ACTIONS.get(message, _command_unknown)()
 
 
 def mqtt_command_d5_received(client: MQTT, topic: str, message: str) -> None:
@@ -208,18 +359,8 @@ def mqtt_command_d5_received(client: MQTT, topic: str, message: str) -> None:
     :param str message: The message of the incoming MQTT based command.
     """
 
-    if DEBUG:
-        print(f"Command received: {topic} {message}")
-    if message == "get":
-        mqtt_publish_gpio_d5_status()
-    elif message in ("high", "low"):
-        gpio_d5.value = True if message == "high" else False
-        if DEBUG:
-            print(f"D5 GPIO pin set {message}.")
-        mqtt_publish_gpio_d5_status()
-    else:
-        if DEBUG:
-            print("ERROR: Unknown command.")
+    dbg(f"Command received: {topic} {message}")
+    _D5_COMMAND_ACTIONS.get(message, _command_unknown)()
 
 
 def mqtt_connected(client: MQTT, userdata: any, flags: int, rc: int) -> None:
@@ -234,8 +375,7 @@ def mqtt_connected(client: MQTT, userdata: any, flags: int, rc: int) -> None:
     :param int rc: The connect operation's return code; not utilized.
     """
 
-    if DEBUG:
-        print(f"\nBroker connected: {client.broker}")
+    dbg(f"\nBroker connected: {client.broker}")
 
 
 def mqtt_disconnected(client: MQTT, userdata: any, rc: int) -> None:
@@ -249,8 +389,7 @@ def mqtt_disconnected(client: MQTT, userdata: any, rc: int) -> None:
     :param int rc: The disconnect operation's return code; not utilized.
     """
 
-    if DEBUG:
-        print(f"Broker disconnected: {client.broker}")
+    dbg(f"Broker disconnected: {client.broker}")
 
 
 def mqtt_message_received(client: MQTT, topic: str, message: str) -> None:
@@ -264,9 +403,8 @@ def mqtt_message_received(client: MQTT, topic: str, message: str) -> None:
     :param str message: The message of the incoming MQTT based command.
     """
 
-    if DEBUG:
-        print(f"Command received: {topic} {message}")
-        print("ERROR: Unknown command.")
+    dbg(f"Command received: {topic} {message}")
+    dbg("ERROR: Unknown command.")
 
 
 def mqtt_published(client: MQTT, userdata: any, topic: str, pid: int) -> None:
@@ -288,9 +426,8 @@ def mqtt_published(client: MQTT, userdata: any, topic: str, pid: int) -> None:
     :param int pid: The message ID; not utilized.
     """
 
-    if DEBUG:
-        # print(f"Status published: {topic} {message}")  # preferred, but unavailable
-        print(f"Status published: {topic}")
+    # dbg(f"Status published: {topic} {message}")  # preferred, but unavailable
+    dbg(f"Status published: {topic}")
 
 
 def mqtt_subscribed(client: MQTT, userdata: any, topic: str, granted_qos: int) -> None:
@@ -307,8 +444,7 @@ def mqtt_subscribed(client: MQTT, userdata: any, topic: str, granted_qos: int) -
         subscription; not utilized.
     """
 
-    if DEBUG:
-        print(f"Subscribed to topic: {topic}")
+    dbg(f"Subscribed to topic: {topic}")
 
 
 def mqtt_unsubscribed(client: MQTT, userdata: any, topic: str, pid: int) -> None:
@@ -324,8 +460,7 @@ def mqtt_unsubscribed(client: MQTT, userdata: any, topic: str, pid: int) -> None
     :param int pid: The message ID; not utilized.
     """
 
-    if DEBUG:
-        print(f"Unsubscribed from topic: {topic}")
+    dbg(f"Unsubscribed from topic: {topic}")
 
 
 # User Functions
@@ -340,17 +475,46 @@ def configure_mqtt_client() -> None:
     # Setup WiFi network and MQTT broker connections
     if IS_RASPBERRY_PI_SBC:
         socket_pool = socket
-    if board.board_id == "raspberry_pi_pico_w":
+    if IS_PICO_W:
         wifi.radio.connect(secrets.wifi["ssid"], secrets.wifi["password"])  # connect to WiFi network
         socket_pool = socketpool.SocketPool(wifi.radio)
     mqtt_client = MQTT.MQTT(
         broker=secrets.mqtt["broker_url"],
         username=secrets.mqtt["broker_username"],
         password=secrets.mqtt["broker_password"],
-        client_id=secrets.mqtt["client_id"],
-        socket_pool=socket_pool
+        client_id=CLIENT_ID,
+        socket_pool=socket_pool,
+        keep_alive=MQTT_KEEP_ALIVE,
+        socket_timeout=MQTT_SOCKET_TIMEOUT,
+        recv_timeout=MQTT_RECV_TIMEOUT
     )
 
+    # Bound the receive path; MiniMQTT's _sock_exact_recv has been seen to
+    # miscompute its buffer size into a multi-GB allocation attempt, which is
+    # fatal on the Pico W, so validate the requested size before the allocation
+    original_sock_exact_recv = mqtt_client._sock_exact_recv
+
+    def bounded_sock_exact_recv(bufsize: int, timeout: float = None) -> bytearray:
+        """Validates the requested receive buffer size against
+        *MQTT_RECV_BUFFER_LIMIT* before delegating to the MQTT client's
+        original implementation.
+
+        :param int bufsize: The requested receive buffer size, in bytes.
+        :param float timeout: The read timeout, in seconds, forwarded to the
+            original implementation when provided.
+        :raises MQTT.MMQTTException: If the requested size is negative or
+            exceeds the limit; returning a short read instead would
+            desynchronize the protocol parser.
+        """
+
+        if bufsize < 0 or bufsize > MQTT_RECV_BUFFER_LIMIT:
+            raise MQTT.MMQTTException(f"Invalid receive buffer size: {bufsize}")
+        if timeout is None:
+            return original_sock_exact_recv(bufsize)
+        return original_sock_exact_recv(bufsize, timeout=timeout)
+
+    mqtt_client._sock_exact_recv = bounded_sock_exact_recv
+
     # Enable debugging messages
     if DEBUG == 2:  # display MQTT debugging messages
         mqtt_client.enable_logger(logger, log_level=logger.DEBUG)
@@ -362,25 +526,67 @@ def configure_mqtt_client() -> None:
     # mqtt_client.on_publish = mqtt_published  # not utilized
     mqtt_client.on_subscribe = mqtt_subscribed
     mqtt_client.on_unsubscribe = mqtt_unsubscribed
-    mqtt_client.add_topic_callback(
-        f"{secrets.mqtt['client_id']}/command/cpu_temperature",
-        mqtt_command_cpu_temperature_received
-    )
-    mqtt_client.add_topic_callback(
-        f"{secrets.mqtt['client_id']}/command/D5",
-        mqtt_command_d5_received
-    )
+    add_topic_callback = mqtt_client.add_topic_callback
+    add_topic_callback(TOPIC_CMD_CPU, mqtt_command_cpu_temperature_received)
+    add_topic_callback(TOPIC_CMD_D5, mqtt_command_d5_received)
+
+
+def _tune_mqtt_socket() -> None:
+    """Applies latency tuning options to the MQTT client's underlying socket.
+
+    Disables Nagle's algorithm (*TCP_NODELAY*) on all platforms; the status
+    payloads published here are under 20 bytes and would otherwise wait up to
+    ~40 ms for the kernel to coalesce them with more outgoing data.
+
+    On a Raspberry Pi SBC, additionally sets the kernel's *SO_BUSY_POLL*
+    option so the receive path busy-polls for up to
+    *MQTT_SOCKET_BUSY_POLL_US* microseconds before falling back to an
+    interrupt driven wakeup, cutting the latency of incoming commands.
+    Requires Linux 3.11 or later and typically the CAP_NET_ADMIN capability;
+    the option is skipped silently when unavailable.  The
+    `net.core.busy_read` sysctl provides the equivalent system-wide default.
+
+    Must be called after each (re)connection since the client creates a new
+    socket each time it connects.
+    """
+
+    sock = mqtt_client._sock  # the socket created by the client's last connect
+    if IS_RASPBERRY_PI_SBC:
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            pass
+        try:
+            so_busy_poll: int = getattr(socket, "SO_BUSY_POLL", 46)  # constant missing from older Python releases
+            sock.setsockopt(socket.SOL_SOCKET, so_busy_poll, MQTT_SOCKET_BUSY_POLL_US)
+        except OSError:  # e.g. insufficient privileges or unsupported kernel
+            pass
+    elif IS_PICO_W:
+        try:
+            sock.setsockopt(socketpool.SocketPool.IPPROTO_TCP, socketpool.SocketPool.TCP_NODELAY, 1)
+        except (AttributeError, OSError):  # older CircuitPython releases lack the option
+            pass
 
 
 def connect_mqtt_broker() -> None:
-    """Connects to the MQTT broker."""
+    """Connects to the MQTT broker.
 
-    if DEBUG:
-        print("Connecting to MQTT broker...", end="")
-    while mqtt_client.connect():
-        if DEBUG:
-            print(".", end="")
-        sleep(1)  # wait 1 second
+    Failed connection attempts are retried with an exponentially increasing
+    delay, capped at *MQTT_RECONNECT_DELAY_MAX* seconds, so an extended broker
+    outage does not peg the CPU or flood the network with connection requests.
+    """
+
+    dbg("Connecting to MQTT broker...", end="")
+    delay: float = 1.0
+    while True:
+        try:
+            mqtt_client.connect()
+            break
+        except (MQTT.MMQTTException, OSError):
+            dbg(".", end="")
+            sleep(delay)
+            delay = min(delay * 2, MQTT_RECONNECT_DELAY_MAX)
+    _tune_mqtt_socket()
 
 
 def mqtt_check_and_report_status() -> None:
@@ -388,89 +594,153 @@ def mqtt_check_and_report_status() -> None:
     and reports any significant changes to the MQTT broker.
 
     Turns on or off the high temperature alert (publishes MQTT based commands to
-    turn on/off the Arduino LED) depending on the CPU's temperature value.
+    turn on/off the Arduino LED) depending on the CPU's temperature value.  The
+    alert command is always published on its own topic with qos = 1 so the
+    Arduino's subscription and delivery guarantee are preserved.
+
+    Status updates are always published retained on their individual topics;
+    when more than one occurs within the same loop cycle, a supplementary JSON
+    message combining them is also published on the *<client_id>/status/batch*
+    topic so subscribers can receive the cycle's updates in one MQTT frame.
     """
 
-    # CPU Temperature Status
-    current_cpu_temperature_value: float = 0
-    if IS_RASPBERRY_PI_SBC:
-        current_cpu_temperature_value = gpiozero.CPUTemperature().temperature
-    elif board.board_id == "raspberry_pi_pico_w":
-        current_cpu_temperature_value = microcontroller.cpu.temperature
-    if abs(current_cpu_temperature_value - previous_cpu_temperature_value) > 2.0:
-        mqtt_publish_cpu_temperature_status()
-
-    # GPIO D5 Status
+    pending: list = []  # (key, topic, message) status updates for this cycle
+
+    # CPU Temperature Status; sampled at most once per interval since the
+    # temperature read is the most expensive operation in the loop cycle
+    now: int = monotonic_ns()
+    if now >= state.next_cpu_temperature_sample_time:
+        state.next_cpu_temperature_sample_time = now + CPU_TEMPERATURE_SAMPLE_INTERVAL_NS
+        current_cpu_temperature_value: float = _read_cpu_temp()
+        current_cpu_temperature_value = round(current_cpu_temperature_value * 2) / 2.0  # quantize to 0.5 °C to filter sensor noise
+        if abs(current_cpu_temperature_value - state.previous_cpu_temperature_value) > 2.0:
+            pending.append(("cpu", TOPIC_STATUS_CPU, f"{current_cpu_temperature_value:.1f}"))
+            state.previous_cpu_temperature_value = current_cpu_temperature_value
+
+        # High CPU Temperature Alert; a Schmitt trigger style hysteresis check
+        # with a single comparison per sample and one publish point
+        new_alert: bool = (
+            current_cpu_temperature_value >= cpu_temperature_threshold_low
+            if state.high_cpu_temperature_alert
+            else current_cpu_temperature_value > cpu_temperature_threshold_high
+        )
+        if new_alert != state.high_cpu_temperature_alert:
+            state.high_cpu_temperature_alert = new_alert
+            dbg(f"High temperature alert {'enabled' if new_alert else 'disabled'}.")
+            alert_command: bytes = ALERT_LED_ON if new_alert else ALERT_LED_OFF
+            mqtt_client.publish("Arduino/command/LED", alert_command, qos=1)  # hard-coded client ID for Arduino
+            dbg(f"Command published: Arduino/command/LED {alert_command.decode()}")
+
+    # GPIO D5 Status; checked every cycle since a GPIO read is cheap
     current_gpio_d5_value: bool = gpio_d5.value
-    if current_gpio_d5_value != previous_gpio_d5_value:
-        mqtt_publish_gpio_d5_status()
-
-    # High CPU Temperature Alert
-    global high_cpu_temperature_alert
-    if current_cpu_temperature_value > cpu_temperature_threshold_high and not high_cpu_temperature_alert:
-        high_cpu_temperature_alert = True
-        if DEBUG:
-            print("High temperature alert enabled.")
-        mqtt_client.publish("Arduino/command/LED", "on", qos=1)  # hard-coded client ID for Arduino
-        if DEBUG:
-            print("Command published: Arduino/command/LED on")
-    elif current_cpu_temperature_value < cpu_temperature_threshold_low and high_cpu_temperature_alert:
-        high_cpu_temperature_alert = False
-        if DEBUG:
-            print("High temperature alert disabled.")
-        mqtt_client.publish("Arduino/command/LED", "off", qos=1)  # hard-coded client ID for Arduino
-        if DEBUG:
-            print("Command published: Arduino/command/LED off")
+    if current_gpio_d5_value != state.previous_gpio_d5_value:
+        current_gpio_d5_status: bytes = STATUS_D5_HIGH if current_gpio_d5_value else STATUS_D5_LOW
+        pending.append(("d5", TOPIC_STATUS_D5, current_gpio_d5_status))
+        state.previous_gpio_d5_value = current_gpio_d5_value
+
+    # Publish accumulated status updates on their retained topics
+    for _, topic, message in pending:
+        mqtt_client.publish(topic, message, retain=True)
+        dbg(f"Status published: {topic} {message.decode() if isinstance(message, bytes) else message}")
+    if len(pending) > 1:  # supplementary combined message for batch subscribers
+        batch: str = json.dumps({
+            key: message.decode() if isinstance(message, bytes) else message
+            for key, _, message in pending
+        })
+        mqtt_client.publish(TOPIC_STATUS_BATCH, batch)
+        dbg(f"Status published: {TOPIC_STATUS_BATCH} {batch}")
 
 
 def mqtt_publish_cpu_temperature_status() -> None:
     """Publishes the status (value) of the CPU's temperature to the MQTT broker."""
 
-    global previous_cpu_temperature_value
-    current_cpu_temperature_value: float = 0
-    if IS_RASPBERRY_PI_SBC:
-        current_cpu_temperature_value = gpiozero.CPUTemperature().temperature
-    elif board.board_id == "raspberry_pi_pico_w":
-        current_cpu_temperature_value = microcontroller.cpu.temperature
+    current_cpu_temperature_value: float = _read_cpu_temp()
+    current_cpu_temperature_value = round(current_cpu_temperature_value * 2) / 2.0  # quantize to 0.5 °C to filter sensor noise
+    current_cpu_temperature_status: str = f"{current_cpu_temperature_value:.1f}"
     mqtt_client.publish(
-        f"{secrets.mqtt['client_id']}/status/cpu_temperature",
-        current_cpu_temperature_value,
+        TOPIC_STATUS_CPU,
+        current_cpu_temperature_status,
         retain=True
     )
-    if DEBUG:
-        print(f"Status published: {secrets.mqtt['client_id']}/status/cpu_temperature {current_cpu_temperature_value}")
-    previous_cpu_temperature_value = current_cpu_temperature_value
+    dbg(f"Status published: {TOPIC_STATUS_CPU} {current_cpu_temperature_status}")
+    state.previous_cpu_temperature_value = current_cpu_temperature_value
 
 
 def mqtt_publish_gpio_d5_status() -> None:
     """Publishes the status (value) of the D5 GPIO pin to the MQTT broker."""
 
-    global previous_gpio_d5_value
     current_gpio_d5_value: bool = gpio_d5.value
-    current_gpio_d5_status: str = "high" if current_gpio_d5_value == True else "low"
+    current_gpio_d5_status: bytes = STATUS_D5_HIGH if current_gpio_d5_value else STATUS_D5_LOW
     mqtt_client.publish(
-        f"{secrets.mqtt['client_id']}/status/D5",
+        TOPIC_STATUS_D5,
         current_gpio_d5_status,
         retain=True
     )
-    if DEBUG:
-        print(f"Status published: {secrets.mqtt['client_id']}/status/D5 {current_gpio_d5_status}")
-    previous_gpio_d5_value = current_gpio_d5_value
+    dbg(f"Status published: {TOPIC_STATUS_D5} {current_gpio_d5_status.decode()}")
+    state.previous_gpio_d5_value = current_gpio_d5_value
+
+
+# Command Dispatch
+def _command_d5_set_high() -> None:
+    """Sets the D5 GPIO pin high and publishes its status."""
+
+    gpio_d5.value = True
+    dbg("D5 GPIO pin set high.")
+    mqtt_publish_gpio_d5_status()
+
+
+def _command_d5_set_low() -> None:
+    """Sets the D5 GPIO pin low and publishes its status."""
+
+    gpio_d5.value = False
+    dbg("D5 GPIO pin set low.")
+    mqtt_publish_gpio_d5_status()
+
+
+def _command_unknown() -> None:
+    """Alerts the user to an unknown command being received."""
+
+    dbg("ERROR: Unknown command.")
+
+
+_CPU_COMMAND_ACTIONS: dict = {
+    "get": mqtt_publish_cpu_temperature_status
+}
+"""Maps *cpu_temperature* command messages to their handler functions."""
+
+_D5_COMMAND_ACTIONS: dict = {
+    "get": mqtt_publish_gpio_d5_status,
+    "high": _command_d5_set_high,
+    "low": _command_d5_set_low
+}
+"""Maps *D5* command messages to their handler functions."""
+
+
+def _cleanup() -> None:
+    """Cleans up and reports the final status before the program exits.
+
+    Unsubscribes from commands, turns off the D5 GPIO pin, publishes the final
+    status, and disconnects from the MQTT broker; additionally releases the
+    GPIO resources on a Raspberry Pi SBC.
+    """
+
+    mqtt_client.unsubscribe(TOPIC_CMD_WILDCARD)
+    gpio_d5.value = False
+    mqtt_publish_cpu_temperature_status()
+    mqtt_publish_gpio_d5_status()
+    mqtt_client.disconnect()
+    if IS_RASPBERRY_PI_SBC:
+        GPIO.cleanup()
 
 
 def main() -> None:
     """The main program entry."""
 
-    def loop() -> None:
-        """The common looping code for all architectures."""
-
-        if not mqtt_client.is_connected():  # keep broker connected
-            mqtt_client.reconnect()
-        mqtt_client.loop(1)  # listen for incoming commands; the timeout argument (1) is not typically needed, but I get the "Resource temporarily unavailable" error if I don't provide a value
-        mqtt_check_and_report_status()  # report status changes
+    if not IS_RASPBERRY_PI_SBC and not IS_PICO_W:
+        print(f"ERROR: The {board.board_id} board is not supported.")
+        return
 
-    if DEBUG:
-        print("Running in DEBUG mode.  Turn off for normal operation.")
+    dbg("Running in DEBUG mode.  Turn off for normal operation.")
     if IS_RASPBERRY_PI_SBC:
         print("Press CTRL-C to exit.")
 
@@ -482,32 +752,65 @@ def main() -> None:
     configure_mqtt_client()
     connect_mqtt_broker()
 
+    # Bind frequently used functions to locals so each loop cycle avoids the
+    # repeated global and attribute lookups
+    mqtt_is_connected = mqtt_client.is_connected
+    mqtt_reconnect = mqtt_client.reconnect
+    mqtt_loop = mqtt_client.loop
+    check_and_report_status = mqtt_check_and_report_status
+
+    def loop() -> None:
+        """The common looping code for all architectures."""
+
+        if not mqtt_is_connected():  # keep broker connected
+            now: float = monotonic()
+            if now < state.mqtt_next_reconnect_time:  # wait out the reconnection backoff
+                return
+            try:
+                mqtt_reconnect()
+                _tune_mqtt_socket()
+                state.mqtt_reconnect_delay = 1.0
+            except (MQTT.MMQTTException, OSError):
+                state.mqtt_next_reconnect_time = now + state.mqtt_reconnect_delay
+                state.mqtt_reconnect_delay = min(state.mqtt_reconnect_delay * 2, MQTT_RECONNECT_DELAY_MAX)
+                return
+        # Listen for incoming commands; drain all pending messages in one pass
+        # instead of processing at most one message per cycle.  On the SBC,
+        # skip the MQTT read path entirely when the socket has no data, waking
+        # it periodically so keep alive pings are still sent.  The bounded
+        # select() wait lets the idle path sleep in the kernel (keeping the
+        # loop from busy-spinning) while still waking as soon as data arrives.
+        run_mqtt_loop: bool = True
+        if IS_RASPBERRY_PI_SBC:
+            readable, _, _ = select.select([mqtt_client._sock], [], [], MQTT_SOCKET_TIMEOUT)
+            if not readable and monotonic() < state.next_mqtt_maintenance_time:
+                run_mqtt_loop = False
+        if run_mqtt_loop:
+            state.next_mqtt_maintenance_time = monotonic() + MQTT_KEEP_ALIVE / 2
+            for _ in range(MQTT_LOOP_MAX_READS):
+                try:
+                    pending_rcs = mqtt_loop(MQTT_SOCKET_TIMEOUT)
+                except (MQTT.MMQTTException, OSError):  # e.g. "Resource temporarily unavailable" when no data is ready
+                    break
+                if not pending_rcs:  # no more pending messages
+                    break
+        check_and_report_status()  # report status changes
+
     # Publish initial status
     mqtt_publish_cpu_temperature_status()
     mqtt_publish_gpio_d5_status()
 
     # Subscribe to commands
-    mqtt_client.subscribe(f"{secrets.mqtt['client_id']}/command/#", qos=1)
+    mqtt_client.subscribe(TOPIC_CMD_WILDCARD, qos=1)
 
-    # Platform specific
-    if IS_RASPBERRY_PI_SBC:
-        try:
-            while True:
-                loop()
-        except KeyboardInterrupt:  # detect CTRL-C pressed
-            print()
-        finally:  # clean up and report status before exiting
-            mqtt_client.unsubscribe(f"{secrets.mqtt['client_id']}/command/#")
-            gpio_d5.value = False
-            mqtt_publish_cpu_temperature_status()
-            mqtt_publish_gpio_d5_status()
-            mqtt_client.disconnect()
-            GPIO.cleanup()
-    elif board.board_id == "raspberry_pi_pico_w":
+    # Common loop for all architectures
+    try:
         while True:
             loop()
-    else:
-        print(f"ERROR: The {board.board_id} board is not supported.")
+    except KeyboardInterrupt:  # detect CTRL-C pressed
+        print()
+    finally:  # clean up and report status before exiting
+        _cleanup()
 
 
 if __name__ == "__main__":  # required for generating Sphinx documentation